@@ -1,11 +1,19 @@
-from repository import NewsRepository
-from llm import LLM
-from newsbot import NewsBot
-from dotenv import load_dotenv
-import os
+from startup import StartupTimer
+
+timer = StartupTimer()
+
+with timer.stage("imports"):
+    from repository import NewsRepository
+    from llm import LLM
+    from newsbot import NewsBot
+    from dotenv import load_dotenv
+    import os
 
 load_dotenv()
 
+# Fast start checks the schema version instead of running DDL on every boot
+fast_start = os.getenv("FAST_START", "").lower() in ("1", "true", "yes")
+
 # Connect the database
 repository = NewsRepository(
     username=os.getenv("MYSQL_USER"),
@@ -13,6 +21,7 @@ repository = NewsRepository(
     database=os.getenv("MYSQL_DATABASE"),
     hostname=os.getenv("MYSQL_HOST") or "localhost",
     port=os.getenv("MYSQL_PORT") or 3306,
+    check_schema_version=fast_start,
 )
 
 # Initialize LLM Models
@@ -65,6 +74,7 @@ tg_bot = NewsBot(
     watch_channels=watch_channels,
     repository=repository,
     llm=llm,
+    timer=timer,
 )
 
 if __name__ == "__main__":
@@ -1,8 +1,15 @@
-from openai import OpenAI
 from repository import NewsRepository
+from typing import TYPE_CHECKING
 import json
 import re
 import string
+import threading
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Seconds to wait for an LLM endpoint during warm-up
+WARM_UP_TIMEOUT = 5
 
 
 def parse_latest_json(input_string: str) -> str:
@@ -40,17 +47,58 @@ class LLM:
         words_model: str,
         repository: NewsRepository,
     ):
-        self.translate_client = OpenAI(
-            api_key=translate_api_key,
-            base_url=translate_base_url,
-        )
-        self.words_client = OpenAI(
-            api_key=words_api_key,
-            base_url=words_base_url,
-        )
+        self.translate_api_key = translate_api_key
+        self.translate_base_url = translate_base_url
+        self.words_api_key = words_api_key
+        self.words_base_url = words_base_url
         self.translate_model = translate_model
         self.words_model = words_model
         self.repository = repository
+        self._translate_client = None
+        self._words_client = None
+        self._clients_lock = threading.Lock()
+
+    def __create_clients(self):
+        # openai is heavy to import, so it is loaded on first use or in warm_up()
+        from openai import OpenAI
+
+        with self._clients_lock:
+            if self._translate_client is None:
+                self._translate_client = OpenAI(
+                    api_key=self.translate_api_key,
+                    base_url=self.translate_base_url,
+                )
+            if self._words_client is None:
+                self._words_client = OpenAI(
+                    api_key=self.words_api_key,
+                    base_url=self.words_base_url,
+                )
+
+    @property
+    def translate_client(self) -> "OpenAI":
+        if self._translate_client is None:
+            self.__create_clients()
+        return self._translate_client
+
+    @property
+    def words_client(self) -> "OpenAI":
+        if self._words_client is None:
+            self.__create_clients()
+        return self._words_client
+
+    def warm_up(self):
+        """
+        Import openai, build the HTTP clients and open their connections
+        with a cheap request ahead of the first translation
+        """
+        self.__create_clients()
+        for client in (self._translate_client, self._words_client):
+            try:
+                client.with_options(
+                    timeout=WARM_UP_TIMEOUT, max_retries=0
+                ).models.list()
+            except Exception as e:
+                print(f"Unable to warm up LLM client {client.base_url}: {e}")
 
     def convert_to_a1(self, text: str) -> str | None:
         task_text = f"""Retell this news on greek using basic level of language A1. Be concise and creative. Do not use more than 6 sentences. News to retell:
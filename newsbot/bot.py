@@ -4,6 +4,8 @@ from hydrogram.types import  Photo, Video, InputMediaPhoto, InputMediaVideo
 from hydrogram.enums import ParseMode
 from repository import NewsRepository, News, NewsMedia
 from llm import LLM
+from startup import StartupTimer
+import asyncio
 import re
 
 
@@ -18,11 +20,15 @@ class NewsBot:
         watch_channels: list,
         repository: NewsRepository,
         llm: LLM,
+        timer: StartupTimer | None = None,
     ):
         self.post_channels = post_channels
         self.watch_channels = [int(id) for id in watch_channels]
         self.repository = repository
         self.llm = llm
+        self.timer = timer if timer is not None else StartupTimer()
+        # Set once logged in and the DB is warmed up, handlers wait for it
+        self.ready = asyncio.Event()
         self.app = Client("my_account", api_id=telegram_api_id, api_hash=telegram_api_key)
         self.app.add_handler(
             MessageHandler(
@@ -147,6 +153,7 @@ Source: {news.source}
         Handle incoming messages from the watched channels
         """
         print(f"Received message from {message.chat.id}")
+        await self.ready.wait()
 
         await client.read_chat_history(message.chat.id)
 
@@ -195,8 +202,34 @@ Source: {news.source}
         except Exception as e:
             print(f"Unable to get translation: {e}")
 
+    async def __login(self):
+        with self.timer.stage("telegram login"):
+            await self.app.start()
+
+    async def __warm_up(self, name: str, func, required: bool = True):
+        with self.timer.stage(name):
+            try:
+                await asyncio.to_thread(func)
+            except Exception as e:
+                print(f"Warm-up of {name} failed: {e}")
+                if required:
+                    raise
+
+    async def __warm_up_in_background(self, name: str, func):
+        await self.__warm_up(name, func, required=False)
+        print(f"Background warm-up of {name} took {self.timer.stages[name]:.3f}s")
+
     async def __run(self):
-        await self.app.start()
+        # LLM clients are only needed for translation, so they do not gate readiness
+        self.llm_warm_up = asyncio.create_task(
+            self.__warm_up_in_background("llm clients", self.llm.warm_up)
+        )
+        await asyncio.gather(
+            self.__login(),
+            self.__warm_up("database", self.repository.warm_up),
+        )
+        self.ready.set()
+        self.timer.report()
         await self.process_unpublished_messages()
         await idle()
         await self.app.stop()
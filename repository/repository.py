@@ -1,8 +1,9 @@
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, JSON
+from sqlalchemy import create_engine, inspect, Column, Integer, String, Boolean, JSON
 from sqlalchemy.orm import sessionmaker, joinedload, Session
 from .news import News, NewsMedia
 from .words import Words
 from .base import ModelBase
+from .schema import SchemaVersion, SCHEMA_VERSION
 from urllib.parse import quote_plus
 from typing import Optional
 from functools import wraps
@@ -37,19 +38,55 @@ class NewsRepository:
         database: str,
         hostname: str = "localhost",
         port: int = 3306,
+        check_schema_version: bool = False,
     ):
         p = quote_plus(password)
         url = f"mysql+pymysql://{username}:{p}@{hostname}:{port}/{database}"
         self.engine = create_engine(url, pool_size=1, pool_pre_ping=True)
         self.local_session = sessionmaker(bind=self.engine)
-        self.create_tables()
+        self.words_cache = dict()
+        self.check_schema_version = check_schema_version
+        # With schema version check the DDL is deferred to warm_up()
+        if not check_schema_version:
+            self.create_tables()
 
     def create_tables(self):
         ModelBase.metadata.create_all(self.engine)
 
+    def ensure_schema(self):
+        """
+        Run DDL and stamp the version only when the stored schema version differs
+        """
+        if self.get_schema_version() != SCHEMA_VERSION:
+            print("Schema version mismatch, creating tables")
+            self.create_tables()
+            self.set_schema_version(SCHEMA_VERSION)
+
+    def warm_up(self):
+        """
+        Check the schema, open a pooled connection and fill the words cache.
+        Database errors are raised, so the bot does not start without a schema
+        """
+        if self.check_schema_version:
+            self.ensure_schema()
+        self.load_words_cache()
+
     def create_session(self) -> Session:
         return self.local_session()
 
+    def get_schema_version(self) -> int | None:
+        if not inspect(self.engine).has_table(SchemaVersion.__tablename__):
+            return None
+        with self.create_session() as session:
+            schema_version = session.query(SchemaVersion).first()
+            return schema_version.version if schema_version is not None else None
+
+    def set_schema_version(self, version: int):
+        with self.create_session() as session:
+            session.query(SchemaVersion).delete()
+            session.add(SchemaVersion(version=version))
+            session.commit()
+
     @with_session
     def add_news(self, news: News, session: Session) -> int | None:
         session.add(news)
@@ -118,10 +155,15 @@ class NewsRepository:
 
     @with_session
     def add_words(self, words: dict, session: Session):
+        new_words = []
         for word, (translation, speech_part) in words.items():
             # Check if the word already exists
             existing_word = session.query(Words).filter_by(word=word).first()
             if existing_word:  # Skip existing word
+                self.words_cache[word] = [
+                    existing_word.translation,
+                    existing_word.speech_part,
+                ]
                 continue
 
             # Create a new Words object
@@ -130,12 +172,28 @@ class NewsRepository:
             )
 
             session.add(new_word)
+            new_words.append(new_word)
         session.commit()
+        for new_word in new_words:
+            self.words_cache[new_word.word] = [
+                new_word.translation,
+                new_word.speech_part,
+            ]
 
     @with_session
     def get_words(self, words: list, session: Session) -> dict:
-        results = session.query(Words).filter(Words.word.in_(words)).all()
         known_words = {
-            result.word: [result.translation, result.speech_part] for result in results
+            word: self.words_cache[word] for word in words if word in self.words_cache
         }
+        missing_words = [word for word in words if word not in known_words]
+        if len(missing_words) > 0:
+            results = session.query(Words).filter(Words.word.in_(missing_words)).all()
+            for result in results:
+                known_words[result.word] = [result.translation, result.speech_part]
+                self.words_cache[result.word] = known_words[result.word]
         return known_words
+
+    def load_words_cache(self):
+        with self.create_session() as session:
+            for result in session.query(Words).all():
+                self.words_cache[result.word] = [result.translation, result.speech_part]
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer
+from .base import ModelBase
+
+# Bump when a table is added, so the next fast start re-runs create_all.
+# create_all never alters existing tables, column changes need a real migration
+SCHEMA_VERSION = 1
+
+
+class SchemaVersion(ModelBase):
+    __tablename__ = "schema_version"
+
+    version = Column(Integer, primary_key=True)
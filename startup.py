@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+import time
+
+
+class StartupTimer:
+    """
+    Collects wall-clock durations of the startup stages and prints them as a breakdown.
+    Stages may overlap when they run concurrently.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stages = dict()
+
+    @contextmanager
+    def stage(self, name: str):
+        stage_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = time.perf_counter() - stage_start
+
+    def report(self) -> None:
+        total = time.perf_counter() - self.started_at
+        lines = [f"  {name:<24} {duration:7.3f}s" for name, duration in self.stages.items()]
+        print("Startup timing:\n" + "\n".join(lines) + f"\n  {'total':<24} {total:7.3f}s")